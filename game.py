@@ -2,28 +2,34 @@ import random
 import sys
 import json
 import os
-import glob
 import csv
-from dataclasses import dataclass, field, asdict
-from typing import List, Optional
+import functools
+from itertools import islice
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
+
+from utils import DATACLASS_SLOTS, dump_json, parse_json, parse_int
 
 # Import running board functionality
 from running_boards import (
     RunningBoard, Trip,
     create_running_board_interactive,
     view_running_boards,
+    assign_bus_to_running_board,
+    view_running_board_details,
+    delete_running_board_interactive,
     list_running_boards,
-    load_running_board,
+    list_running_board_objects,
     save_running_board
 )
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Stop:
     name: str
     minutes_from_prev: int  # Changed from distance_from_prev_km
 
     def to_dict(self):
-        return asdict(self)
+        return {"name": self.name, "minutes_from_prev": self.minutes_from_prev}
 
     @staticmethod
     def from_dict(data):
@@ -35,13 +41,23 @@ class Stop:
             minutes = int(data.get("distance_from_prev_km", 0) * 2)
             return Stop(name=data["name"], minutes_from_prev=minutes)
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Route:
     name: str
     stops: List[Stop]
     base_schedule_minutes: int
     current_schedule_minutes: int
     assigned_bus_id: Optional[int] = None
+    _total_time: int = field(init=False, repr=False, compare=False, default=0)
+
+    def __post_init__(self):
+        # Stops never change after a route is created, so the journey time is
+        # worked out once here rather than on every view/simulated day
+        self._total_time = sum(stop.minutes_from_prev for stop in islice(self.stops, 1, None))
+
+    @property
+    def total_time(self) -> int:
+        return self._total_time
 
     def to_dict(self):
         return {
@@ -63,7 +79,7 @@ class Route:
             assigned_bus_id=data.get("assigned_bus_id"),
         )
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Bus:
     bus_id: int
     model: str
@@ -78,17 +94,33 @@ class Bus:
     dlc_source: Optional[str] = None  # Track which DLC this bus came from
     livery: str = "Standard"  # New: Bus livery/color scheme
 
+    @property
+    def display_fleet_no(self) -> str:
+        return self.fleet_number if self.fleet_number else "N/A"
+
     def consume_fuel(self, minutes, speed=30):
-        # Convert minutes to distance assuming average speed
-        distance = (minutes / 60) * speed
-        speed_factor = speed / 50
-        used = distance * self.fuel_efficiency * speed_factor
-        self.fuel_level = max(self.fuel_level - used, 0)
+        # Distance at the average speed (minutes / 60 * speed) scaled by the
+        # speed relative to the 50 km/h rating (speed / 50), folded together
+        used = minutes * speed * speed / 3000 * self.fuel_efficiency
+        remaining = self.fuel_level - used
+        self.fuel_level = remaining if remaining > 0 else 0
         return used
 
     def to_dict(self):
-        data = asdict(self)
-        return data
+        return {
+            "bus_id": self.bus_id,
+            "model": self.model,
+            "capacity": self.capacity,
+            "fuel_capacity": self.fuel_capacity,
+            "fuel_level": self.fuel_level,
+            "fuel_efficiency": self.fuel_efficiency,
+            "assigned_route": self.assigned_route,
+            "health": self.health,
+            "purchase_price": self.purchase_price,
+            "fleet_number": self.fleet_number,
+            "dlc_source": self.dlc_source,
+            "livery": self.livery,
+        }
 
     @staticmethod
     def from_dict(data):
@@ -107,29 +139,116 @@ class Bus:
             livery=data.get("livery", "Standard"),
         )
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ManagerState:
+    # Field order is the order fields are written in a save: the small
+    # company details come first so load_game can preview a save from its top
     company_name: str
-    routes: List[Route] = field(default_factory=list)
-    fleet: List[Bus] = field(default_factory=list)
     money: float = 2500000.0
     reputation: float = 50.0
     day: int = 1
     next_bus_id: int = 1
     use_running_boards: bool = False  # Toggle between static and dynamic assignment
     fuel_price: float = 1.60  # Dynamic fuel price per litre (min 1.25, max 2.00)
+    routes: List[Route] = field(default_factory=list)
+    fleet: List[Bus] = field(default_factory=list)
+    # Lookup indexes (not saved) so bus/route lookups don't scan the whole fleet
+    _bus_by_id: Dict[int, Bus] = field(init=False, repr=False, compare=False, default_factory=dict)
+    _route_by_bus_id: Dict[int, Route] = field(init=False, repr=False, compare=False, default_factory=dict)
+    _route_by_name: Dict[str, Route] = field(init=False, repr=False, compare=False, default_factory=dict)
+    _fleet_numbers: Set[str] = field(init=False, repr=False, compare=False, default_factory=set)
+    # Every numeric fleet number below this one is known to be in use
+    _next_auto_fleet_number: int = field(init=False, repr=False, compare=False, default=1)
+
+    def __post_init__(self):
+        self.rebuild_indexes()
+
+    def rebuild_indexes(self):
+        """Rebuild the bus, route and fleet number indexes from the fleet and routes"""
+        self._bus_by_id = {bus.bus_id: bus for bus in self.fleet}
+        # Route names aren't unique; the first route with a name wins, as before
+        self._route_by_name = {route.name: route for route in reversed(self.routes)}
+        self._fleet_numbers = {bus.fleet_number for bus in self.fleet if bus.fleet_number}
+        self._next_auto_fleet_number = 1
+        self._route_by_bus_id = {
+            route.assigned_bus_id: route for route in self.routes
+            if route.assigned_bus_id is not None
+        }
+
+    def get_bus(self, bus_id) -> Optional[Bus]:
+        return self._bus_by_id.get(bus_id)
+
+    def get_route_for_bus(self, bus_id) -> Optional[Route]:
+        return self._route_by_bus_id.get(bus_id)
+
+    def get_route(self, name) -> Optional[Route]:
+        return self._route_by_name.get(name)
+
+    def fleet_number_in_use(self, fleet_number: str) -> bool:
+        return fleet_number in self._fleet_numbers
+
+    def next_free_fleet_number(self) -> str:
+        """Lowest unused numeric fleet number, for auto-assignment"""
+        n = self._next_auto_fleet_number
+        while str(n) in self._fleet_numbers:
+            n += 1
+        self._next_auto_fleet_number = n
+        return str(n)
+
+    def add_bus(self, bus: Bus):
+        self.fleet.append(bus)
+        self._bus_by_id[bus.bus_id] = bus
+        if bus.fleet_number:
+            self._fleet_numbers.add(bus.fleet_number)
+
+    def add_route(self, route: Route):
+        self.routes.append(route)
+        self._route_by_name.setdefault(route.name, route)
+
+    def remove_route(self, index: int) -> Route:
+        route = self.routes.pop(index)
+        if self._route_by_name.get(route.name) is route:
+            # Fall back to the next route sharing the name, if there is one
+            same_name = next((r for r in self.routes if r.name == route.name), None)
+            if same_name is None:
+                del self._route_by_name[route.name]
+            else:
+                self._route_by_name[route.name] = same_name
+        return route
+
+    def set_fleet_number(self, bus: Bus, fleet_number: str):
+        old_number = bus.fleet_number
+        if old_number:
+            self._fleet_numbers.discard(old_number)
+            # A freed number may now be the lowest one available again
+            if old_number.isdecimal() and int(old_number) < self._next_auto_fleet_number:
+                self._next_auto_fleet_number = int(old_number)
+        bus.fleet_number = fleet_number
+        self._fleet_numbers.add(fleet_number)
+
+    def assign_bus(self, route: Route, bus: Bus):
+        """Assign a bus to a route, taking it off any route it was running before"""
+        old_route = self._route_by_bus_id.pop(bus.bus_id, None)
+        if old_route is not None:
+            old_route.assigned_bus_id = None
+        if route.assigned_bus_id is not None:
+            self._route_by_bus_id.pop(route.assigned_bus_id, None)
+
+        route.assigned_bus_id = bus.bus_id
+        bus.assigned_route = route.name
+        self._route_by_bus_id[bus.bus_id] = route
 
     def to_dict(self):
         return {
             "company_name": self.company_name,
-            "routes": [route.to_dict() for route in self.routes],
-            "fleet": [bus.to_dict() for bus in self.fleet],
             "money": self.money,
             "reputation": self.reputation,
             "day": self.day,
             "next_bus_id": self.next_bus_id,
             "use_running_boards": self.use_running_boards,
             "fuel_price": self.fuel_price,
+            "routes": [route.to_dict() for route in self.routes],
+            "fleet": [bus.to_dict() for bus in self.fleet],
         }
 
     @staticmethod
@@ -173,9 +292,67 @@ AVAILABLE_LIVERIES = [
     "Eco-Friendly Green",
 ]
 
+# Day simulation tuning
+TICKET_PRICE = 2.50
+STATIC_EVENTS = ("flat tyre", "engine trouble", "heavy traffic")
+STATIC_EVENT_CHANCE = 0.2
+STATIC_EVENT_COST = 200
+TIGHT_SCHEDULE_DELAY_CHANCE = 0.3
+RUNNING_BOARD_EVENTS = ("minor delay", "passenger incident", "route deviation")
+RUNNING_BOARD_EVENT_CHANCE = 0.10
+# Longest stretch "Simulate Multiple Days" will run in one go
+MAX_SIMULATED_DAYS = 365
+
+
+# Base game vehicles: (model, capacity, fuel capacity, fuel efficiency, price, DLC source)
+BASE_GAME_SHOP = (
+    ("ADL Enviro200 [Base Game]", 40, 160.0, 0.26, 90000, None),
+    ("ADL Enviro200 MMC [Base Game]", 40, 160.0, 0.25, 95000, None),
+    ("ADL Enviro400 [Base Game]", 80, 240.0, 0.38, 135000, None),
+    ("ADL Enviro400 MMC [Base Game]", 80, 240.0, 0.38, 140000, None),
+    ("ADL Enviro400 City [Base Game]", 80, 240.0, 0.37, 145000, None),
+    ("Wright Streetlite DF [Base Game]", 40, 150.0, 0.25, 72000, None),
+    ("Wright Streetlite WF [Base Game]", 40, 150.0, 0.24, 73000, None),
+    ("Wright Streetdeck Ultroliner [Base Game]", 75, 220.0, 0.35, 130000, None),
+    ("Wright Eclipse Urban [Base Game]", 40, 150.0, 0.26, 70000, None),
+    ("Wright Eclipse Urban 2 [Base Game]", 40, 150.0, 0.25, 72000, None),
+    ("Wright Eclipse Gemini [Base Game]", 80, 230.0, 0.37, 130000, None),
+    ("Wright Eclipse Gemini 2 [Base Game]", 80, 230.0, 0.36, 132000, None),
+    ("Wright Eclipse Gemini 3 [Base Game]", 80, 230.0, 0.35, 135000, None),
+    ("Scania N94UD Omnidekka [Base Game]", 80, 240.0, 0.40, 138000, None),
+    ("Scania N270UD Omnicity [Base Game]", 80, 230.0, 0.38, 140000, None),
+    ("Scania N230UD Enviro400 [Base Game]", 80, 240.0, 0.37, 137000, None),
+    ("Scania N250UD Enviro400 MMC [Base Game]", 80, 240.0, 0.36, 142000, None),
+    ("Scania L94UB Wright Solar [Base Game]", 40, 150.0, 0.26, 72000, None),
+    ("Optare Solo [Base Game]", 30, 120.0, 0.22, 60000, None),
+    ("Optare Solo SR [Base Game]", 30, 120.0, 0.22, 62000, None),
+    ("Dennis Trident Optare Olympus [Base Game]", 75, 230.0, 0.38, 125000, None),
+    ("Volvo B7TL Plaxton President [Base Game]", 80, 230.0, 0.39, 130000, None),
+    ("Dennis Dart MPD [Base Game]", 35, 140.0, 0.24, 65000, None),
+)
+
+def format_shop_row(index, item):
+    model, capacity, fuel_cap, efficiency, price, dlc_source = item
+    dlc_tag = f" [{dlc_source}]" if dlc_source else ""
+    return f"[{index}] {model}{dlc_tag} | Capacity: {capacity} | Price: £{price:,}"
+
+# The base game part of the shop listing never changes, so it is rendered once
+BASE_GAME_SHOP_LISTING = "\n".join(
+    format_shop_row(i, item) for i, item in enumerate(BASE_GAME_SHOP, 1)
+)
+
+
+# Fields every DLC vehicle entry must provide
+DLC_VEHICLE_FIELDS = ("model", "capacity", "fuel_capacity", "fuel_efficiency", "price")
+
+# Last DLC catalogue loaded, as (file signature, vehicles). The shop reuses it
+# until a DLC file is added, removed or modified.
+_dlc_cache = None
+
 
 def load_dlc_vehicles():
     """Load all vehicle DLC files from the dlcs_and_mods/ directory"""
+    global _dlc_cache
     dlc_vehicles = []
 
     # Get the script's directory (CBMText folder)
@@ -184,15 +361,43 @@ def load_dlc_vehicles():
 
     if not os.path.exists(dlc_folder):
         print(f"Note: dlcs_and_mods folder not found at {dlc_folder}")
-        return dlc_vehicles
+        # No folder means no DLC files, so cache that under an empty
+        # signature too rather than handing the shop a new list every visit
+        if _dlc_cache is None or _dlc_cache[0] != ():
+            _dlc_cache = ((), dlc_vehicles)
+        return _dlc_cache[1]
 
     # Find all JSON files in the dlcs_and_mods folder
-    dlc_files = glob.glob(os.path.join(dlc_folder, "*.json"))
-
+    dlc_files = []
+    signature = []
+    with os.scandir(dlc_folder) as entries:
+        for entry in entries:
+            if entry.name.startswith(".") or not entry.name.endswith(".json"):
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                info = entry.stat()
+            except OSError:
+                continue
+            dlc_files.append(entry.path)
+            signature.append((entry.path, info.st_mtime_ns, info.st_size))
+    signature = tuple(signature)
+    if _dlc_cache is not None and _dlc_cache[0] == signature:
+        return _dlc_cache[1]
+
+    # Read every file first, then parse them all in one pass
+    blobs = []
     for dlc_file in dlc_files:
         try:
-            with open(dlc_file, 'r') as f:
-                data = json.load(f)
+            with open(dlc_file, "rb") as f:
+                blobs.append((dlc_file, f.read()))
+        except OSError as e:
+            print(f"Warning: Error loading {dlc_file}: {e}. Skipping.")
+
+    for dlc_file, raw in blobs:
+        try:
+            data = parse_json(raw)
 
             # Validate DLC format
             if "dlc_name" not in data or "vehicles" not in data:
@@ -204,8 +409,7 @@ def load_dlc_vehicles():
 
             # Validate each vehicle
             for vehicle in vehicles:
-                required_fields = ["model", "capacity", "fuel_capacity", "fuel_efficiency", "price"]
-                if all(field in vehicle for field in required_fields):
+                if all(field in vehicle for field in DLC_VEHICLE_FIELDS):
                     # Add DLC source to each vehicle
                     vehicle["dlc_source"] = dlc_name
                     dlc_vehicles.append(vehicle)
@@ -219,9 +423,38 @@ def load_dlc_vehicles():
         except Exception as e:
             print(f"Warning: Error loading {dlc_file}: {e}. Skipping.")
 
+    _dlc_cache = (signature, dlc_vehicles)
     return dlc_vehicles
 
 
+# Full shop as (DLC vehicles it was built from, shop rows, listing text); only
+# rebuilt when load_dlc_vehicles() hands back a different catalogue
+_shop_cache = None
+
+
+def get_shop():
+    """Base game plus DLC shop rows and their rendered listing"""
+    global _shop_cache
+    dlc_vehicles = load_dlc_vehicles()
+    if _shop_cache is None or _shop_cache[0] is not dlc_vehicles:
+        dlc_shop = tuple(
+            (
+                dlc_vehicle["model"],
+                dlc_vehicle["capacity"],
+                dlc_vehicle["fuel_capacity"],
+                dlc_vehicle["fuel_efficiency"],
+                dlc_vehicle["price"],
+                dlc_vehicle["dlc_source"]
+            )
+            for dlc_vehicle in dlc_vehicles
+        )
+        lines = [BASE_GAME_SHOP_LISTING]
+        for i, item in enumerate(dlc_shop, len(BASE_GAME_SHOP) + 1):
+            lines.append(format_shop_row(i, item))
+        _shop_cache = (dlc_vehicles, BASE_GAME_SHOP + dlc_shop, "\n".join(lines))
+    return _shop_cache[1], _shop_cache[2]
+
+
 def save_game(state: ManagerState):
     # Create saves folder if it doesn't exist
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -242,12 +475,56 @@ def save_game(state: ManagerState):
 
     filepath = os.path.join(saves_folder, filename)
 
+    # Write to a temporary file and swap it in, so a crash mid-save can't
+    # leave a half-written file in place of the previous save
+    tmp_path = filepath + ".tmp"
     try:
-        with open(filepath, "w") as f:
-            json.dump(state.to_dict(), f, indent=2)
+        # Serialise fully in memory first, then hand the file one write
+        payload = dump_json(state)
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+            # Make sure the data is on disk before the rename, or a power cut
+            # could leave the new name pointing at an empty file
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
         print(f"Game saved successfully to 'saves/{filename}'.")
     except Exception as e:
         print(f"Error saving game: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+SAVE_PREVIEW_FIELDS = ("company_name", "day", "money")
+SAVE_PREVIEW_BYTES = 1024
+
+
+def read_save_preview(filepath) -> dict:
+    """Company name, day and money from a save, parsing only its first lines.
+
+    Saves are written with those fields at the top, one per line. Older saves
+    put them after the routes and fleet, so those fall back to a full parse.
+    """
+    with open(filepath, "rb") as f:
+        head = f.read(SAVE_PREVIEW_BYTES)
+        lines = head.split(b"\n")
+        if len(head) == SAVE_PREVIEW_BYTES:
+            lines.pop()  # May be cut off part way through
+        preview = {}
+        for line in lines:
+            # Top level keys are the only lines indented by exactly two spaces
+            if not line.startswith(b'  "') or line.startswith(b'   '):
+                continue
+            key, _, value = line.strip().partition(b": ")
+            key = parse_json(key)
+            if key in SAVE_PREVIEW_FIELDS:
+                preview[key] = parse_json(value.rstrip(b","))
+                if len(preview) == len(SAVE_PREVIEW_FIELDS):
+                    return preview
+        f.seek(0)
+        return parse_json(f.read())
+
 
 def load_game() -> Optional[ManagerState]:
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -257,20 +534,22 @@ def load_game() -> Optional[ManagerState]:
         print("No saves folder found. No saved games available.")
         return None
 
-    # List available save files
-    save_files = [f for f in os.listdir(saves_folder) if f.endswith('.json')]
+    # List available save files, sorted once for both the menu and the lookup
+    with os.scandir(saves_folder) as entries:
+        save_files = sorted(
+            entry.name for entry in entries
+            if entry.name.endswith('.json') and entry.is_file()
+        )
 
     if not save_files:
         print("No saved games found in saves folder.")
         return None
 
     print("\n--- Available Saved Games ---")
-    for i, save_file in enumerate(sorted(save_files), 1):
+    for i, save_file in enumerate(save_files, 1):
         # Try to read company name from save
         try:
-            filepath = os.path.join(saves_folder, save_file)
-            with open(filepath, "r") as f:
-                data = json.load(f)
+            data = read_save_preview(os.path.join(saves_folder, save_file))
             company = data.get("company_name", "Unknown")
             day = data.get("day", "?")
             money = data.get("money", 0)
@@ -286,14 +565,14 @@ def load_game() -> Optional[ManagerState]:
         return None
 
     # Check if it's a number (selecting from list)
-    try:
-        choice_num = int(choice)
+    choice_num = parse_int(choice)
+    if choice_num is not None:
         if 1 <= choice_num <= len(save_files):
-            filename = sorted(save_files)[choice_num - 1]
+            filename = save_files[choice_num - 1]
         else:
             print("Invalid selection.")
             return None
-    except ValueError:
+    else:
         # It's a filename
         filename = choice
         if not filename.endswith('.json'):
@@ -305,8 +584,8 @@ def load_game() -> Optional[ManagerState]:
     filepath = os.path.join(saves_folder, filename)
 
     try:
-        with open(filepath, "r") as f:
-            data = json.load(f)
+        with open(filepath, "rb") as f:
+            data = parse_json(f.read())
         state = ManagerState.from_dict(data)
         print(f"Game loaded successfully from 'saves/{filename}'.")
         return state
@@ -324,7 +603,7 @@ def update_fuel_price(state: ManagerState):
     new_price = state.fuel_price + fluctuation
     
     # Clamp price between min (1.25) and max (2.00)
-    state.fuel_price = max(1.25, min(2.00, new_price))
+    state.fuel_price = 1.25 if new_price < 1.25 else 2.00 if new_price > 2.00 else new_price
 
 
 def view_fuel_price(state: ManagerState):
@@ -342,61 +621,91 @@ def view_fuel_price(state: ManagerState):
     print(f"Status: {status}")
 
 
+def read_int(prompt: str = "> ") -> Optional[int]:
+    """Read a whole number from the player, or return None if it isn't one"""
+    value = parse_int(input(prompt))
+    if value is None:
+        print("Invalid input.")
+    return value
+
+
+# Static part of the main menu, built once
+MAIN_MENU_OPTIONS = "\n".join([
+    "1) View Routes",
+    "2) View Fleet",
+    "3) Assign Bus to Route",
+    "4) Change Route Schedule",
+    "5) Run Day Simulation",
+    "6) Buy New Bus",
+    "7) Import Fleet from CSV",
+    "8) Add New Route (Costs £500 per stop)",
+    "9) Delete Route",
+    "10) View Company Status",
+    "11) View Fuel Price Details",
+    "12) Save Game",
+    "13) Load Game",
+    "14) Running Board Management",
+    "15) Toggle Assignment Mode",
+    "16) Quit",
+    "17) Simulate Multiple Days",
+])
+
 def print_main_menu(state: ManagerState):
     mode = "Running Boards" if state.use_running_boards else "Static Routes"
-    print(f"\n===== City Bus Manager – {state.company_name} [Mode: {mode}] =====")
-    print(f"Fuel Price: £{state.fuel_price:.2f}/L")
-    print("1) View Routes")
-    print("2) View Fleet")
-    print("3) Assign Bus to Route")
-    print("4) Change Route Schedule")
-    print("5) Run Day Simulation")
-    print("6) Buy New Bus")
-    print("7) Import Fleet from CSV")
-    print("8) Add New Route (Costs £500 per stop)")
-    print("9) Delete Route")
-    print("10) View Company Status")
-    print("11) View Fuel Price Details")
-    print("12) Save Game")
-    print("13) Load Game")
-    print("14) Running Board Management")
-    print("15) Toggle Assignment Mode")
-    print("16) Quit")
+    print(f"\n===== City Bus Manager – {state.company_name} [Mode: {mode}] =====\n"
+          f"Fuel Price: £{state.fuel_price:.2f}/L\n"
+          f"{MAIN_MENU_OPTIONS}")
+
+# Table rows are cached on the values they show, so re-opening a view whose
+# routes/buses haven't changed reuses the formatted strings
+@functools.lru_cache(maxsize=512)
+def format_route_row(index, name, total_time, schedule, bus_model):
+    return f"[{index}] {name} | Journey Time: {total_time} mins | Schedule: {schedule} mins | Bus: {bus_model}"
+
+@functools.lru_cache(maxsize=512)
+def format_fleet_row(bus_id, model, dlc_source, fleet_no, livery, capacity, fuel_level, health, assignment_info):
+    dlc_tag = f" [{dlc_source}]" if dlc_source else ""
+    return f"[{bus_id}] {model}{dlc_tag} (Fleet No: {fleet_no}) | Livery: {livery} | Capacity: {capacity} | Fuel: {fuel_level:.1f}L | Health: {health} | {assignment_info}"
 
 def view_routes(state: ManagerState):
     if not state.routes:
         print("\nNo routes available yet.")
         return
-    print("\n--- Routes ---")
+    lines = ["\n--- Routes ---"]
     for i, route in enumerate(state.routes, 1):
-        assigned_bus = next((b.model for b in state.fleet if b.bus_id == route.assigned_bus_id), "None")
-        total_time = sum(stop.minutes_from_prev for stop in route.stops[1:])
-        print(f"[{i}] {route.name} | Journey Time: {total_time} mins | Schedule: {route.current_schedule_minutes} mins | Bus: {assigned_bus}")
+        bus = state.get_bus(route.assigned_bus_id)
+        assigned_bus = bus.model if bus else "None"
+        lines.append(format_route_row(i, route.name, route.total_time, route.current_schedule_minutes, assigned_bus))
+    # One write for the whole table rather than a print per route
+    print("\n".join(lines))
 
 def view_fleet(state: ManagerState):
     if not state.fleet:
         print("\nNo buses in fleet yet.")
         return
     while True:
-        print("\n--- Fleet ---")
+        # Group the running boards by the bus they're assigned to
+        boards_by_bus = {}
+        if state.use_running_boards:
+            for board in list_running_board_objects():
+                if board.assigned_bus_id is not None:
+                    boards_by_bus.setdefault(board.assigned_bus_id, []).append(board.name)
+
+        lines = ["\n--- Fleet ---"]
         for bus in state.fleet:
-            route_name = next((r.name for r in state.routes if r.assigned_bus_id == bus.bus_id), "None")
-            fn = bus.fleet_number if bus.fleet_number else "N/A"
-            dlc_tag = f" [{bus.dlc_source}]" if bus.dlc_source else ""
+            route = state.get_route_for_bus(bus.bus_id)
+            route_name = route.name if route else "None"
 
             # Check running board assignments
-            rb_assignments = []
-            if state.use_running_boards:
-                for board_name in list_running_boards():
-                    board = load_running_board(board_name)
-                    if board and board.assigned_bus_id == bus.bus_id:
-                        rb_assignments.append(board.name)
+            rb_assignments = boards_by_bus.get(bus.bus_id)
 
             assignment_info = f"Route: {route_name}"
             if rb_assignments:
                 assignment_info = f"Running Boards: {', '.join(rb_assignments)}"
 
-            print(f"[{bus.bus_id}] {bus.model}{dlc_tag} (Fleet No: {fn}) | Livery: {bus.livery} | Capacity: {bus.capacity} | Fuel: {bus.fuel_level:.1f}L | Health: {bus.health} | {assignment_info}")
+            lines.append(format_fleet_row(bus.bus_id, bus.model, bus.dlc_source, bus.display_fleet_no, bus.livery,
+                                          bus.capacity, bus.fuel_level, bus.health, assignment_info))
+        print("\n".join(lines))
 
         print("\nOptions: [E] Edit Fleet Number, [L] Change Livery, [Q] Return to Main Menu")
         choice = input("> ").strip().lower()
@@ -414,40 +723,37 @@ def edit_fleet_number(state: ManagerState):
         print("\nNo buses in fleet to edit.")
         return
 
-    print("\n--- Edit Fleet Number ---")
-    print("Current fleet:")
+    lines = ["\n--- Edit Fleet Number ---", "Current fleet:"]
     for bus in state.fleet:
-        fn = bus.fleet_number if bus.fleet_number else "N/A"
-        print(f"[{bus.bus_id}] {bus.model} (Fleet No: {fn})")
+        lines.append(f"[{bus.bus_id}] {bus.model} (Fleet No: {bus.display_fleet_no})")
+    print("\n".join(lines))
 
     print("Enter bus ID to edit fleet number (or 0 to cancel):")
-    try:
-        bus_id = int(input("> "))
-    except ValueError:
-        print("Invalid input.")
+    bus_id = read_int()
+    if bus_id is None:
         return
 
     if bus_id == 0:
         print("Edit cancelled.")
         return
 
-    bus = next((b for b in state.fleet if b.bus_id == bus_id), None)
+    bus = state.get_bus(bus_id)
     if not bus:
         print("Bus ID not found.")
         return
 
-    print(f"Current fleet number: {bus.fleet_number if bus.fleet_number else 'N/A'}")
+    print(f"Current fleet number: {bus.display_fleet_no}")
     print("Enter new fleet number (or leave blank to cancel):")
     new_number = input("> ").strip()
     if new_number == "":
         print("Edit cancelled.")
         return
 
-    if any(b.fleet_number == new_number and b.bus_id != bus.bus_id for b in state.fleet):
+    if new_number != bus.fleet_number and state.fleet_number_in_use(new_number):
         print(f"Fleet number '{new_number}' already in use by another bus. Edit cancelled.")
         return
 
-    bus.fleet_number = new_number
+    state.set_fleet_number(bus, new_number)
     print(f"Fleet number updated to '{new_number}' for bus ID {bus.bus_id}.")
 
 def change_bus_livery(state: ManagerState):
@@ -456,41 +762,36 @@ def change_bus_livery(state: ManagerState):
         print("\nNo buses in fleet to edit.")
         return
 
-    print("\n--- Change Bus Livery ---")
-    print("Current fleet:")
+    lines = ["\n--- Change Bus Livery ---", "Current fleet:"]
     for bus in state.fleet:
-        fn = bus.fleet_number if bus.fleet_number else "N/A"
-        print(f"[{bus.bus_id}] {bus.model} (Fleet No: {fn}) - Current Livery: {bus.livery}")
+        lines.append(f"[{bus.bus_id}] {bus.model} (Fleet No: {bus.display_fleet_no}) - Current Livery: {bus.livery}")
+    print("\n".join(lines))
 
     print("\nEnter bus ID to change livery (or 0 to cancel):")
-    try:
-        bus_id = int(input("> "))
-    except ValueError:
-        print("Invalid input.")
+    bus_id = read_int()
+    if bus_id is None:
         return
 
     if bus_id == 0:
         print("Livery change cancelled.")
         return
 
-    bus = next((b for b in state.fleet if b.bus_id == bus_id), None)
+    bus = state.get_bus(bus_id)
     if not bus:
         print("Bus ID not found.")
         return
 
-    print(f"\n--- Available Liveries for {bus.model} (Fleet No: {bus.fleet_number if bus.fleet_number else 'N/A'}) ---")
+    print(f"\n--- Available Liveries for {bus.model} (Fleet No: {bus.display_fleet_no}) ---")
     print(f"Current livery: {bus.livery}")
-    print("\nChoose a new livery:")
-    
+    lines = ["\nChoose a new livery:"]
     for i, livery in enumerate(AVAILABLE_LIVERIES, 1):
         current_marker = " (CURRENT)" if livery == bus.livery else ""
-        print(f"[{i}] {livery}{current_marker}")
+        lines.append(f"[{i}] {livery}{current_marker}")
+    print("\n".join(lines))
 
     print("\nEnter livery number (or 0 to cancel):")
-    try:
-        livery_choice = int(input("> "))
-    except ValueError:
-        print("Invalid input.")
+    livery_choice = read_int()
+    if livery_choice is None:
         return
 
     if livery_choice == 0:
@@ -526,7 +827,7 @@ def change_bus_livery(state: ManagerState):
     state.money -= livery_cost
     
     print(f"\n✓ Livery successfully changed!")
-    print(f"  Bus: {bus.model} (Fleet No: {bus.fleet_number if bus.fleet_number else 'N/A'})")
+    print(f"  Bus: {bus.model} (Fleet No: {bus.display_fleet_no})")
     print(f"  Old livery: {old_livery}")
     print(f"  New livery: {new_livery}")
     print(f"  Cost: £{livery_cost:.2f}")
@@ -544,31 +845,26 @@ def assign_bus_to_route(state: ManagerState):
         print("\nNo routes available. Add some first.")
         return
 
-    print("\nSelect Bus to assign:")
+    lines = ["\nSelect Bus to assign:"]
     for bus in state.fleet:
-        fn = bus.fleet_number if bus.fleet_number else "N/A"
-        print(f"[{bus.bus_id}] {bus.model} (Fleet No: {fn}, Capacity: {bus.capacity})")
+        lines.append(f"[{bus.bus_id}] {bus.model} (Fleet No: {bus.display_fleet_no}, Capacity: {bus.capacity})")
+    print("\n".join(lines))
 
-    try:
-        bus_id = int(input("> "))
-    except ValueError:
-        print("Invalid input.")
+    bus_id = read_int()
+    if bus_id is None:
         return
 
-    bus = next((b for b in state.fleet if b.bus_id == bus_id), None)
+    bus = state.get_bus(bus_id)
     if not bus:
         print("Bus not found.")
         return
 
-    print("\nSelect Route:")
-    for i, route in enumerate(state.routes, 1):
-        print(f"[{i}] {route.name}")
+    print("\n".join(["\nSelect Route:"] + [f"[{i}] {route.name}" for i, route in enumerate(state.routes, 1)]))
 
-    try:
-        route_idx = int(input("> ")) - 1
-    except ValueError:
-        print("Invalid input.")
+    route_num = read_int()
+    if route_num is None:
         return
+    route_idx = route_num - 1
 
     if not (0 <= route_idx < len(state.routes)):
         print("Invalid route number.")
@@ -576,13 +872,8 @@ def assign_bus_to_route(state: ManagerState):
 
     route = state.routes[route_idx]
 
-    for r in state.routes:
-        if r.assigned_bus_id == bus.bus_id:
-            r.assigned_bus_id = None
-
-    route.assigned_bus_id = bus.bus_id
-    bus.assigned_route = route.name
-    print(f"Assigned {bus.model} (Fleet No: {bus.fleet_number if bus.fleet_number else 'N/A'}) to {route.name}")
+    state.assign_bus(route, bus)
+    print(f"Assigned {bus.model} (Fleet No: {bus.display_fleet_no}) to {route.name}")
 
 def change_route_schedule(state: ManagerState):
     if not state.routes:
@@ -592,11 +883,10 @@ def change_route_schedule(state: ManagerState):
     for i, route in enumerate(state.routes, 1):
         print(f"[{i}] {route.name} | Current Schedule: {route.current_schedule_minutes} mins")
 
-    try:
-        route_idx = int(input("> ")) - 1
-    except ValueError:
-        print("Invalid input.")
+    route_num = read_int()
+    if route_num is None:
         return
+    route_idx = route_num - 1
 
     if not (0 <= route_idx < len(state.routes)):
         print("Invalid route number.")
@@ -605,19 +895,17 @@ def change_route_schedule(state: ManagerState):
     route = state.routes[route_idx]
     print(f"Enter new schedule time in minutes for {route.name} (base is {route.base_schedule_minutes}):")
 
-    try:
-        new_time = int(input("> "))
-        if new_time < route.base_schedule_minutes // 2:
-            print("Schedule too short! Aborting.")
-            return
-    except ValueError:
-        print("Invalid input.")
+    new_time = read_int()
+    if new_time is None:
+        return
+    if new_time < route.base_schedule_minutes // 2:
+        print("Schedule too short! Aborting.")
         return
 
     route.current_schedule_minutes = new_time
     print(f"Schedule updated: {route.name} now runs in {new_time} minutes.")
 
-def run_day_simulation_static(state: ManagerState):
+def run_day_simulation_static(state: ManagerState, verbose: bool = True):
     """Original static route simulation"""
     if not state.routes:
         print("\nNo routes available to run.")
@@ -626,44 +914,65 @@ def run_day_simulation_static(state: ManagerState):
         print("\nNo buses available to run routes.")
         return
 
-    print(f"\n--- Running Day Simulation (Static Mode): Day {state.day} ---")
+    # A quiet day (verbose=False) skips building its report, not just printing it
+    if verbose:
+        print(f"\n--- Running Day Simulation (Static Mode): Day {state.day} ---")
     total_earnings = 0.0
     total_fuel_cost = 0.0
     reputation_change = 0.0
 
+    # Bind the RNG calls once for the whole day instead of per route
+    rand = random.random
+    randint = random.randint
+    choice = random.choice
+    fuel_price = state.fuel_price
+
+    # Split off routes without a bus first so the main loop only sees routes
+    # that actually run today
+    services = []
     for route in state.routes:
-        bus = next((b for b in state.fleet if b.bus_id == route.assigned_bus_id), None)
-        if not bus:
-            print(f"Route '{route.name}' has no bus assigned! No service today.")
+        bus = state.get_bus(route.assigned_bus_id)
+        if bus:
+            services.append((route, bus))
+        else:
+            if verbose:
+                print(f"Route '{route.name}' has no bus assigned! No service today.")
             reputation_change -= 5
-            continue
 
-        print(f"\nRoute: {route.name}")
-        print(f"Bus: {bus.model} (Fleet No: {bus.fleet_number if bus.fleet_number else 'N/A'}) [Livery: {bus.livery}] (Capacity: {bus.capacity})")
-        print(f"Schedule time: {route.current_schedule_minutes} mins")
+    for route, bus in services:
+        schedule = route.current_schedule_minutes
+        total_time = route.total_time
+        capacity = bus.capacity
 
-        total_time = sum(stop.minutes_from_prev for stop in route.stops[1:])
-        ticket_price = 2.50
+        # Each route's report is collected and printed in one go
+        if verbose:
+            out = [
+                f"\nRoute: {route.name}\n"
+                f"Bus: {bus.model} (Fleet No: {bus.display_fleet_no}) [Livery: {bus.livery}] (Capacity: {capacity})\n"
+                f"Schedule time: {schedule} mins"
+            ]
 
         # Base demand on route length (more stops/time = more passengers)
         avg_demand = int(total_time * 1.5)
-        passengers = min(bus.capacity, random.randint(max(0, avg_demand - 5), avg_demand + 5))
-        earnings = passengers * ticket_price
+        passengers = min(capacity, randint(max(0, avg_demand - 5), avg_demand + 5))
+        earnings = passengers * TICKET_PRICE
 
         fuel_used = bus.consume_fuel(total_time)
-        fuel_cost = fuel_used * state.fuel_price
+        fuel_cost = fuel_used * fuel_price
 
-        if random.random() < 0.2:
-            event = random.choice(["flat tyre", "engine trouble", "heavy traffic"])
-            print(f"** Event: {event}! Delays the route and costs £200 to fix. **")
+        if rand() < STATIC_EVENT_CHANCE:
+            event = choice(STATIC_EVENTS)
+            if verbose:
+                out.append(f"** Event: {event}! Delays the route and costs £{STATIC_EVENT_COST} to fix. **")
             reputation_change -= 3
-            state.money -= 200
+            state.money -= STATIC_EVENT_COST
         else:
             reputation_change += 1
 
-        if route.current_schedule_minutes < route.base_schedule_minutes:
-            if random.random() < 0.3:
-                print("Tight schedule caused delays and made passengers unhappy!")
+        if schedule < route.base_schedule_minutes:
+            if rand() < TIGHT_SCHEDULE_DELAY_CHANCE:
+                if verbose:
+                    out.append("Tight schedule caused delays and made passengers unhappy!")
                 reputation_change -= 2
             else:
                 reputation_change += 1
@@ -673,89 +982,109 @@ def run_day_simulation_static(state: ManagerState):
         total_earnings += earnings
         total_fuel_cost += fuel_cost
 
-        print(f"Passengers carried: {passengers}")
-        print(f"Fare income: £{earnings:.2f}")
-        print(f"Fuel used: {fuel_used:.2f}L costing £{fuel_cost:.2f}")
+        if verbose:
+            out.append(
+                f"Passengers carried: {passengers}\n"
+                f"Fare income: £{earnings:.2f}\n"
+                f"Fuel used: {fuel_used:.2f}L costing £{fuel_cost:.2f}"
+            )
+            print("\n".join(out))
 
     net_profit = total_earnings - total_fuel_cost
     state.money += net_profit
-    state.reputation = max(0.0, min(100.0, state.reputation + reputation_change))
+    reputation = state.reputation + reputation_change
+    state.reputation = 0.0 if reputation < 0.0 else 100.0 if reputation > 100.0 else reputation
     
     # Update fuel price for next day
     update_fuel_price(state)
     
     state.day += 1
 
-    print(f"\nDay {state.day-1} summary:")
-    print(f"Total fare income: £{total_earnings:.2f}")
-    print(f"Total fuel cost: £{total_fuel_cost:.2f}")
-    print(f"Net profit: £{net_profit:.2f}")
-    print(f"Reputation change: {reputation_change:+.1f}")
-    print(f"New reputation: {state.reputation:.1f}/100")
-    print(f"Fuel price for Day {state.day}: £{state.fuel_price:.2f}/L")
-    print(f"Money available: £{state.money:.2f}")
+    if verbose:
+        print(
+            f"\nDay {state.day-1} summary:\n"
+            f"Total fare income: £{total_earnings:.2f}\n"
+            f"Total fuel cost: £{total_fuel_cost:.2f}\n"
+            f"Net profit: £{net_profit:.2f}\n"
+            f"Reputation change: {reputation_change:+.1f}\n"
+            f"New reputation: {state.reputation:.1f}/100\n"
+            f"Fuel price for Day {state.day}: £{state.fuel_price:.2f}/L\n"
+            f"Money available: £{state.money:.2f}"
+        )
+    return True
 
-def run_day_simulation_running_boards(state: ManagerState):
+def run_day_simulation_running_boards(state: ManagerState, verbose: bool = True):
     """New dynamic simulation using running boards"""
-    boards = []
-    for board_name in list_running_boards():
-        board = load_running_board(board_name)
-        if board and board.assigned_bus_id:
-            boards.append(board)
+    boards = [board for board in list_running_board_objects() if board.assigned_bus_id is not None]
 
     if not boards:
         print("\nNo running boards with assigned buses available.")
         print("Use Running Board Management (option 12) to create and assign running boards.")
         return
 
-    print(f"\n--- Running Day Simulation (Running Board Mode): Day {state.day} ---")
-    print(f"Operating {len(boards)} running board(s)...\n")
+    # A quiet day (verbose=False) skips building its report, not just printing it
+    if verbose:
+        print(f"\n--- Running Day Simulation (Running Board Mode): Day {state.day} ---")
+        print(f"Operating {len(boards)} running board(s)...\n")
 
     total_earnings = 0.0
     total_fuel_cost = 0.0
     reputation_change = 0.0
 
+    # Bind the RNG calls once for the whole day instead of per trip
+    rand = random.random
+    randint = random.randint
+    choice = random.choice
+    fuel_price = state.fuel_price
+
     for board in boards:
-        bus = next((b for b in state.fleet if b.bus_id == board.assigned_bus_id), None)
+        bus = state.get_bus(board.assigned_bus_id)
         if not bus:
-            print(f"Running board '{board.name}' has invalid bus assignment! Skipping.")
+            if verbose:
+                print(f"Running board '{board.name}' has invalid bus assignment! Skipping.")
             continue
 
-        print(f"\n--- Running Board: {board.name} ---")
-        print(f"Bus: {bus.model} (Fleet No: {bus.fleet_number if bus.fleet_number else 'N/A'}) [Livery: {bus.livery}]")
-        print(f"Total trips: {len(board.trips)}")
+        # Each board's report is collected and printed in one go
+        if verbose:
+            out = [
+                f"\n--- Running Board: {board.name} ---\n"
+                f"Bus: {bus.model} (Fleet No: {bus.display_fleet_no}) [Livery: {bus.livery}]\n"
+                f"Total trips: {len(board.trips)}"
+            ]
 
         board_earnings = 0.0
         board_fuel = 0.0
         trips_completed = 0
+        # Fuel estimate per minute of journey (30 km/h average), fixed per bus
+        fuel_per_minute = 30 / 60 * bus.fuel_efficiency
 
         for trip in board.trips:
-            route = next((r for r in state.routes if r.name == trip.route_name), None)
+            route = state.get_route(trip.route_name)
             if not route:
-                print(f"  {trip.departure_time} - {trip.route_name}: Route not found! Skipping.")
+                if verbose:
+                    out.append(f"  {trip.departure_time} - {trip.route_name}: Route not found! Skipping.")
                 reputation_change -= 2
                 continue
 
-            total_time = sum(stop.minutes_from_prev for stop in route.stops[1:])
+            total_time = route.total_time
 
             # Check if bus has enough fuel
-            fuel_needed = total_time / 60 * 30 * bus.fuel_efficiency  # Estimate based on time
-            if bus.fuel_level < fuel_needed:
-                print(f"  {trip.departure_time} - {trip.route_name}: ⚠ Insufficient fuel! Trip cancelled.")
+            if bus.fuel_level < total_time * fuel_per_minute:
+                if verbose:
+                    out.append(f"  {trip.departure_time} - {trip.route_name}: ⚠ Insufficient fuel! Trip cancelled.")
                 reputation_change -= 5
                 continue
 
-            ticket_price = 2.50
             avg_demand = int(total_time * 1.5)
-            passengers = min(bus.capacity, random.randint(max(0, avg_demand - 5), avg_demand + 5))
-            earnings = passengers * ticket_price
+            passengers = min(bus.capacity, randint(max(0, avg_demand - 5), avg_demand + 5))
+            earnings = passengers * TICKET_PRICE
 
             fuel_used = bus.consume_fuel(total_time)
-            fuel_cost = fuel_used * state.fuel_price
+            fuel_cost = fuel_used * fuel_price
 
             # Random events
-            if random.random() < 0.10:
-                event = random.choice(["minor delay", "passenger incident", "route deviation"])
+            if rand() < RUNNING_BOARD_EVENT_CHANCE:
+                event = choice(RUNNING_BOARD_EVENTS)
                 reputation_change -= 1
             else:
                 reputation_change += 0.5
@@ -764,37 +1093,77 @@ def run_day_simulation_running_boards(state: ManagerState):
             board_fuel += fuel_cost
             trips_completed += 1
 
-            print(f"  {trip.departure_time} - {trip.route_name} to {trip.destination}: {passengers} pax, £{earnings:.2f}")
+            if verbose:
+                out.append(f"  {trip.departure_time} - {trip.route_name} to {trip.destination}: {passengers} pax, £{earnings:.2f}")
 
         total_earnings += board_earnings
         total_fuel_cost += board_fuel
 
-        print(f"  Board summary: {trips_completed}/{len(board.trips)} trips, £{board_earnings:.2f} income, £{board_fuel:.2f} fuel")
+        if verbose:
+            out.append(f"  Board summary: {trips_completed}/{len(board.trips)} trips, £{board_earnings:.2f} income, £{board_fuel:.2f} fuel")
+            print("\n".join(out))
 
     net_profit = total_earnings - total_fuel_cost
     state.money += net_profit
-    state.reputation = max(0.0, min(100.0, state.reputation + reputation_change))
+    reputation = state.reputation + reputation_change
+    state.reputation = 0.0 if reputation < 0.0 else 100.0 if reputation > 100.0 else reputation
     
     # Update fuel price for next day
     update_fuel_price(state)
     
     state.day += 1
 
-    print(f"\n--- Day {state.day-1} Summary ---")
-    print(f"Total fare income: £{total_earnings:.2f}")
-    print(f"Total fuel cost: £{total_fuel_cost:.2f}")
-    print(f"Net profit: £{net_profit:.2f}")
-    print(f"Reputation change: {reputation_change:+.1f}")
-    print(f"New reputation: {state.reputation:.1f}/100")
-    print(f"Fuel price for Day {state.day}: £{state.fuel_price:.2f}/L")
-    print(f"Money available: £{state.money:.2f}")
-
-def run_day_simulation(state: ManagerState):
-    """Route to appropriate simulation based on mode"""
+    if verbose:
+        print(
+            f"\n--- Day {state.day-1} Summary ---\n"
+            f"Total fare income: £{total_earnings:.2f}\n"
+            f"Total fuel cost: £{total_fuel_cost:.2f}\n"
+            f"Net profit: £{net_profit:.2f}\n"
+            f"Reputation change: {reputation_change:+.1f}\n"
+            f"New reputation: {state.reputation:.1f}/100\n"
+            f"Fuel price for Day {state.day}: £{state.fuel_price:.2f}/L\n"
+            f"Money available: £{state.money:.2f}"
+        )
+    return True
+
+def run_day_simulation(state: ManagerState, verbose: bool = True):
+    """Route to appropriate simulation based on mode; True if the day ran"""
     if state.use_running_boards:
-        run_day_simulation_running_boards(state)
-    else:
-        run_day_simulation_static(state)
+        return run_day_simulation_running_boards(state, verbose)
+    return run_day_simulation_static(state, verbose)
+
+def run_multiple_days(state: ManagerState):
+    """Simulate several days back to back, showing one summary line per day"""
+    days = read_int("How many days to simulate? (0 to cancel): ")
+    if not days:
+        return
+    if days < 0:
+        print("Please enter a positive number of days.")
+        return
+    if days > MAX_SIMULATED_DAYS:
+        print(f"You can simulate at most {MAX_SIMULATED_DAYS} days at a time; simulating {MAX_SIMULATED_DAYS}.")
+        days = MAX_SIMULATED_DAYS
+
+    start_money = state.money
+    start_reputation = state.reputation
+    lines = [f"\n--- Simulating {days} Day(s) ---"]
+    days_run = 0
+    for _ in range(days):
+        day = state.day
+        money_before = state.money
+        # Quiet days neither build nor print their per-route reports, which
+        # is what makes a long run cheap
+        if not run_day_simulation(state, verbose=False):
+            break
+        days_run += 1
+        lines.append(f"Day {day}: Net £{state.money - money_before:,.2f} | Reputation {state.reputation:.1f}/100 | Next fuel price £{state.fuel_price:.2f}/L")
+
+    if not days_run:
+        return
+    lines.append(f"\nSimulated {days_run} day(s).")
+    lines.append(f"Money change: £{state.money - start_money:+,.2f} (now £{state.money:,.2f})")
+    lines.append(f"Reputation change: {state.reputation - start_reputation:+.1f} (now {state.reputation:.1f}/100)")
+    print("\n".join(lines))
 
 def import_fleet_from_csv(state: ManagerState):
     """Import buses from a CSV file"""
@@ -858,18 +1227,14 @@ def import_fleet_from_csv(state: ManagerState):
                         continue
                     
                     # Check if fleet number already exists
-                    if fleet_number and any(bus.fleet_number == fleet_number for bus in state.fleet):
+                    if fleet_number and state.fleet_number_in_use(fleet_number):
                         print(f"Row {row_num}: Skipping '{model}' - fleet number {fleet_number} already in use")
                         skipped_count += 1
                         continue
                     
                     # Auto-assign fleet number if not provided
                     if not fleet_number:
-                        existing_numbers = {bus.fleet_number for bus in state.fleet if bus.fleet_number}
-                        n = 1
-                        while str(n) in existing_numbers:
-                            n += 1
-                        fleet_number = str(n)
+                        fleet_number = state.next_free_fleet_number()
                     
                     # Validate livery
                     if livery not in AVAILABLE_LIVERIES:
@@ -889,7 +1254,7 @@ def import_fleet_from_csv(state: ManagerState):
                         fleet_number=fleet_number,
                         livery=livery
                     )
-                    state.fleet.append(new_bus)
+                    state.add_bus(new_bus)
                     total_cost += purchase_price
                     imported_count += 1
                     
@@ -916,58 +1281,15 @@ def import_fleet_from_csv(state: ManagerState):
 
 
 def buy_new_bus(state: ManagerState):
-    # Base game vehicles
-    shop = [
-        ("ADL Enviro200 [Base Game]", 40, 160.0, 0.26, 90000, None),
-        ("ADL Enviro200 MMC [Base Game]", 40, 160.0, 0.25, 95000, None),
-        ("ADL Enviro400 [Base Game]", 80, 240.0, 0.38, 135000, None),
-        ("ADL Enviro400 MMC [Base Game]", 80, 240.0, 0.38, 140000, None),
-        ("ADL Enviro400 City [Base Game]", 80, 240.0, 0.37, 145000, None),
-        ("Wright Streetlite DF [Base Game]", 40, 150.0, 0.25, 72000, None),
-        ("Wright Streetlite WF [Base Game]", 40, 150.0, 0.24, 73000, None),
-        ("Wright Streetdeck Ultroliner [Base Game]", 75, 220.0, 0.35, 130000, None),
-        ("Wright Eclipse Urban [Base Game]", 40, 150.0, 0.26, 70000, None),
-        ("Wright Eclipse Urban 2 [Base Game]", 40, 150.0, 0.25, 72000, None),
-        ("Wright Eclipse Gemini [Base Game]", 80, 230.0, 0.37, 130000, None),
-        ("Wright Eclipse Gemini 2 [Base Game]", 80, 230.0, 0.36, 132000, None),
-        ("Wright Eclipse Gemini 3 [Base Game]", 80, 230.0, 0.35, 135000, None),
-        ("Scania N94UD Omnidekka [Base Game]", 80, 240.0, 0.40, 138000, None),
-        ("Scania N270UD Omnicity [Base Game]", 80, 230.0, 0.38, 140000, None),
-        ("Scania N230UD Enviro400 [Base Game]", 80, 240.0, 0.37, 137000, None),
-        ("Scania N250UD Enviro400 MMC [Base Game]", 80, 240.0, 0.36, 142000, None),
-        ("Scania L94UB Wright Solar [Base Game]", 40, 150.0, 0.26, 72000, None),
-        ("Optare Solo [Base Game]", 30, 120.0, 0.22, 60000, None),
-        ("Optare Solo SR [Base Game]", 30, 120.0, 0.22, 62000, None),
-        ("Dennis Trident Optare Olympus [Base Game]", 75, 230.0, 0.38, 125000, None),
-        ("Volvo B7TL Plaxton President [Base Game]", 80, 230.0, 0.39, 130000, None),
-        ("Dennis Dart MPD [Base Game]", 35, 140.0, 0.24, 65000, None),
-    ]
-
-    # Load DLC vehicles
-    dlc_vehicles = load_dlc_vehicles()
-    for dlc_vehicle in dlc_vehicles:
-        shop.append((
-            dlc_vehicle["model"],
-            dlc_vehicle["capacity"],
-            dlc_vehicle["fuel_capacity"],
-            dlc_vehicle["fuel_efficiency"],
-            dlc_vehicle["price"],
-            dlc_vehicle["dlc_source"]
-        ))
-
-    print("\n--- Bus Shop ---")
-    for i, item in enumerate(shop, 1):
-        model, capacity, fuel_cap, efficiency, price, dlc_source = item
-        dlc_tag = f" [{dlc_source}]" if dlc_source else ""
-        print(f"[{i}] {model}{dlc_tag} | Capacity: {capacity} | Price: £{price:,}")
+    # Base game vehicles plus any installed DLC vehicles
+    shop, listing = get_shop()
+    print("\n--- Bus Shop ---\n" + listing)
 
     print(f"Current money: £{state.money:.2f}")
     print("Select bus to buy or 0 to cancel:")
 
-    try:
-        choice = int(input("> "))
-    except ValueError:
-        print("Invalid input.")
+    choice = read_int()
+    if choice is None:
         return
 
     if choice == 0:
@@ -987,15 +1309,11 @@ def buy_new_bus(state: ManagerState):
     print("Enter fleet number (or leave blank for auto-assignment):")
     entered_number = input("> ").strip()
 
-    existing_numbers = {bus.fleet_number for bus in state.fleet if bus.fleet_number}
     if entered_number == "":
-        n = 1
-        while str(n) in existing_numbers:
-            n += 1
-        fleet_number = str(n)
+        fleet_number = state.next_free_fleet_number()
     else:
         fleet_number = entered_number
-        if fleet_number in existing_numbers:
+        if state.fleet_number_in_use(fleet_number):
             print(f"Fleet number {fleet_number} already in use. Purchase cancelled.")
             return
 
@@ -1003,7 +1321,7 @@ def buy_new_bus(state: ManagerState):
     state.next_bus_id += 1
     new_bus = Bus(bus_id, model, capacity, fuel_cap, fuel_cap, efficiency,
                    purchase_price=price, fleet_number=fleet_number, dlc_source=dlc_source)
-    state.fleet.append(new_bus)
+    state.add_bus(new_bus)
     state.money -= price
     dlc_msg = f" from {dlc_source}" if dlc_source else ""
     print(f"Congratulations! You bought a new {model}{dlc_msg} with fleet number {fleet_number} for £{price:,}.")
@@ -1026,14 +1344,13 @@ def add_route(state: ManagerState):
             print("Stop name cannot be empty.")
             continue
         while True:
-            try:
-                minutes = int(input(f"Travel time from previous stop to {stop_name} in minutes: "))
-                if minutes < 0:
-                    print("Time cannot be negative.")
-                    continue
-                break
-            except ValueError:
+            minutes = parse_int(input(f"Travel time from previous stop to {stop_name} in minutes: "))
+            if minutes is None:
                 print("Please enter a valid number.")
+            elif minutes < 0:
+                print("Time cannot be negative.")
+            else:
+                break
 
         stops.append(Stop(stop_name, minutes))
 
@@ -1052,14 +1369,16 @@ def add_route(state: ManagerState):
         print("You don't have enough money to create this route.")
         return
 
-    total_time = sum(stop.minutes_from_prev for stop in stops[1:])
+    # The route works out its own journey time; the schedule is set from it
+    new_route = Route(name, stops, 0, 0)
     # Add buffer time for base schedule (20% extra for layover/turnaround)
-    base_schedule = int(total_time * 1.2)
+    base_schedule = int(new_route.total_time * 1.2)
+    new_route.base_schedule_minutes = base_schedule
+    new_route.current_schedule_minutes = base_schedule
 
-    new_route = Route(name, stops, base_schedule, base_schedule)
-    state.routes.append(new_route)
+    state.add_route(new_route)
     state.money -= cost
-    print(f"Route '{name}' created with {len(stops)} stops, total journey time {total_time} mins, costing £{cost}.")
+    print(f"Route '{name}' created with {len(stops)} stops, total journey time {new_route.total_time} mins, costing £{cost}.")
 
 def delete_route(state: ManagerState):
     if not state.routes:
@@ -1067,14 +1386,13 @@ def delete_route(state: ManagerState):
         return
     print("\nSelect route to delete:")
     for i, route in enumerate(state.routes, 1):
-        assigned = "(Assigned to bus)" if route.assigned_bus_id else ""
+        assigned = "(Assigned to bus)" if route.assigned_bus_id is not None else ""
         print(f"[{i}] {route.name} {assigned}")
 
-    try:
-        idx = int(input("> ")) - 1
-    except ValueError:
-        print("Invalid input.")
+    choice = read_int()
+    if choice is None:
         return
+    idx = choice - 1
 
     if not (0 <= idx < len(state.routes)):
         print("Invalid route number.")
@@ -1087,52 +1405,54 @@ def delete_route(state: ManagerState):
 
     confirm = input(f"Are you sure you want to delete route '{route.name}'? (y/n): ").strip().lower()
     if confirm == 'y':
-        del state.routes[idx]
+        state.remove_route(idx)
         print(f"Route '{route.name}' deleted.")
     else:
         print("Deletion cancelled.")
 
 def view_company_status(state: ManagerState):
-    print(f"\n--- {state.company_name} Status ---")
-    print(f"Day: {state.day}")
-    print(f"Money: £{state.money:.2f}")
-    print(f"Reputation: {state.reputation:.1f}/100")
-    print(f"Fleet size: {len(state.fleet)} buses")
-    print(f"Routes managed: {len(state.routes)}")
-
     mode = "Running Boards (Dynamic)" if state.use_running_boards else "Static Routes"
-    print(f"Assignment mode: {mode}")
-
+    status = (
+        f"\n--- {state.company_name} Status ---\n"
+        f"Day: {state.day}\n"
+        f"Money: £{state.money:.2f}\n"
+        f"Reputation: {state.reputation:.1f}/100\n"
+        f"Fleet size: {len(state.fleet)} buses\n"
+        f"Routes managed: {len(state.routes)}\n"
+        f"Assignment mode: {mode}"
+    )
     if state.use_running_boards:
         boards_count = len(list_running_boards())
-        print(f"Running boards available: {boards_count}")
+        status += f"\nRunning boards available: {boards_count}"
+    print(status)
+
+RUNNING_BOARD_MENU = "\n".join([
+    "\n--- Running Board Management ---",
+    "1) Create New Running Board",
+    "2) View Running Boards",
+    "3) Assign Bus to Running Board",
+    "4) View Running Board Details",
+    "5) Delete Running Board",
+    "6) Return to Main Menu",
+])
+
+RUNNING_BOARD_MENU_ACTIONS = {
+    "1": create_running_board_interactive,
+    "2": view_running_boards,
+    "3": assign_bus_to_running_board,
+    "4": view_running_board_details,
+    "5": delete_running_board_interactive,
+}
 
 def running_board_menu(state: ManagerState):
     """Running board management submenu"""
     while True:
-        print("\n--- Running Board Management ---")
-        print("1) Create New Running Board")
-        print("2) View Running Boards")
-        print("3) Assign Bus to Running Board")
-        print("4) View Running Board Details")
-        print("5) Delete Running Board")
-        print("6) Return to Main Menu")
+        print(RUNNING_BOARD_MENU)
 
         choice = input("> ").strip()
-
-        if choice == "1":
-            create_running_board_interactive(state)
-        elif choice == "2":
-            view_running_boards(state)
-        elif choice == "3":
-            from running_boards import assign_bus_to_running_board
-            assign_bus_to_running_board(state)
-        elif choice == "4":
-            from running_boards import view_running_board_details
-            view_running_board_details(state)
-        elif choice == "5":
-            from running_boards import delete_running_board_interactive
-            delete_running_board_interactive(state)
+        action = RUNNING_BOARD_MENU_ACTIONS.get(choice)
+        if action:
+            action(state)
         elif choice == "6":
             break
         else:
@@ -1156,6 +1476,26 @@ def toggle_assignment_mode(state: ManagerState):
     else:
         print("Mode change cancelled.")
 
+# Main menu options that only act on the current game state; loading a game
+# and quitting are handled directly in main()
+MAIN_MENU_ACTIONS = {
+    "1": view_routes,
+    "2": view_fleet,
+    "3": assign_bus_to_route,
+    "4": change_route_schedule,
+    "5": run_day_simulation,
+    "6": buy_new_bus,
+    "7": import_fleet_from_csv,
+    "8": add_route,
+    "9": delete_route,
+    "10": view_company_status,
+    "11": view_fuel_price,
+    "12": save_game,
+    "14": running_board_menu,
+    "15": toggle_assignment_mode,
+    "17": run_multiple_days,
+}
+
 def main():
     print("Welcome to City Bus Manager!")
     company_name = input("Please enter your company name (or leave blank to load a game): ").strip()
@@ -1174,38 +1514,13 @@ def main():
     while True:
         print_main_menu(state)
         choice = input("> ").strip()
-        if choice == "1":
-            view_routes(state)
-        elif choice == "2":
-            view_fleet(state)
-        elif choice == "3":
-            assign_bus_to_route(state)
-        elif choice == "4":
-            change_route_schedule(state)
-        elif choice == "5":
-            run_day_simulation(state)
-        elif choice == "6":
-            buy_new_bus(state)
-        elif choice == "7":
-            import_fleet_from_csv(state)
-        elif choice == "8":
-            add_route(state)
-        elif choice == "9":
-            delete_route(state)
-        elif choice == "10":
-            view_company_status(state)
-        elif choice == "11":
-            view_fuel_price(state)
-        elif choice == "12":
-            save_game(state)
+        action = MAIN_MENU_ACTIONS.get(choice)
+        if action:
+            action(state)
         elif choice == "13":
             loaded = load_game()
             if loaded:
                 state = loaded
-        elif choice == "14":
-            running_board_menu(state)
-        elif choice == "15":
-            toggle_assignment_mode(state)
         elif choice == "16":
             print(f"Exiting City Bus Manager. Thanks for playing, {state.company_name}!")
             break
@@ -1,33 +1,47 @@
 import os
-import json
-from dataclasses import dataclass, field, asdict
-from typing import List, Optional
+import re
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
 from datetime import datetime, time
 
-@dataclass
+from utils import DATACLASS_SLOTS, dump_json, parse_json, parse_int
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Trip:
     route_name: str
     destination: str
     departure_time: str  # Format: "HH:MM"
+    # Minutes since midnight, worked out the first time it's asked for
+    _time_minutes: Optional[int] = field(init=False, repr=False, compare=False, default=None)
 
     def to_dict(self):
-        return asdict(self)
+        return {
+            "route_name": self.route_name,
+            "destination": self.destination,
+            "departure_time": self.departure_time,
+        }
 
     @staticmethod
     def from_dict(data):
+        # Route names, destinations and times repeat across trips and boards,
+        # so share one string object for each instead of a copy per trip
         return Trip(
-            route_name=data["route_name"],
-            destination=data["destination"],
-            departure_time=data["departure_time"]
+            route_name=sys.intern(data["route_name"]),
+            destination=sys.intern(data["destination"]),
+            departure_time=sys.intern(data["departure_time"])
         )
 
     def get_time_minutes(self) -> int:
         """Convert time string to minutes since midnight for comparison"""
-        hours, minutes = map(int, self.departure_time.split(':'))
-        return hours * 60 + minutes
+        if self._time_minutes is None:
+            hours, minutes = map(int, self.departure_time.split(':'))
+            self._time_minutes = hours * 60 + minutes
+        return self._time_minutes
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RunningBoard:
     name: str
     trips: List[Trip] = field(default_factory=list)
@@ -51,11 +65,13 @@ class RunningBoard:
 
     def get_total_time(self, routes) -> int:
         """Calculate total time in minutes for all trips in this running board"""
+        # First route with each name, as a scan of the list would find
+        route_by_name = {r.name: r for r in reversed(routes)}
         total = 0
         for trip in self.trips:
-            route = next((r for r in routes if r.name == trip.route_name), None)
+            route = route_by_name.get(trip.route_name)
             if route:
-                total += sum(stop.minutes_from_prev for stop in route.stops[1:])
+                total += route.total_time
         return total
 
     def validate_against_routes(self, routes) -> tuple[bool, str]:
@@ -67,23 +83,83 @@ class RunningBoard:
         return True, ""
 
 
+# Trip times as typed in: hours and minutes separated by a colon
+_TIME_RE = re.compile(r"(\d+):(\d+)")
+
+# Boards live in running_boards/ next to this file
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_BOARDS_FOLDER = os.path.join(_SCRIPT_DIR, "running_boards")
+
+# Boards read from disk, keyed by their sanitised file name. The folder is
+# scanned once on first use; after that saves and deletes keep this in step
+_board_cache: Dict[str, RunningBoard] = {}
+_board_cache_loaded = False
+
+
+class _SafeChars(dict):
+    """Translate table mapping anything but letters, digits, space, _ and - to _"""
+
+    # Filled in per character on first sight, so non-ASCII letters are kept
+    # exactly as str.isalnum() would keep them
+    def __missing__(self, code):
+        char = chr(code)
+        self[code] = code if char.isalnum() or char in (' ', '_', '-') else '_'
+        return self[code]
+
+
+_SAFE_CHARS = _SafeChars()
+
+
+def _safe_name(name: str) -> str:
+    """File name stem for a board name"""
+    return name.translate(_SAFE_CHARS)
+
+
+def _load_board_cache():
+    """Read every running board file into the cache, once per session"""
+    global _board_cache_loaded
+    if _board_cache_loaded:
+        return _board_cache
+    _board_cache_loaded = True
+
+    if not os.path.exists(_BOARDS_FOLDER):
+        return _board_cache
+
+    # Read every board file first, then parse them all in one pass
+    blobs = []
+    with os.scandir(_BOARDS_FOLDER) as entries:
+        for entry in entries:
+            if entry.name.endswith(".json"):
+                try:
+                    with open(entry.path, "rb") as f:
+                        blobs.append((entry.name[:-5], f.read()))
+                except OSError as e:
+                    print(f"Error loading running board: {e}")
+
+    for safe_name, raw in blobs:
+        try:
+            _board_cache[safe_name] = RunningBoard.from_dict(parse_json(raw))
+        except Exception as e:
+            print(f"Error loading running board '{safe_name}': {e}")
+
+    return _board_cache
+
+
 def save_running_board(board: RunningBoard):
     """Save a running board to the running_boards folder"""
     # Create running_boards folder if it doesn't exist
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    boards_folder = os.path.join(script_dir, "running_boards")
-
-    if not os.path.exists(boards_folder):
-        os.makedirs(boards_folder)
-        print(f"Created running_boards folder at {boards_folder}")
+    if not os.path.exists(_BOARDS_FOLDER):
+        os.makedirs(_BOARDS_FOLDER, exist_ok=True)
+        print(f"Created running_boards folder at {_BOARDS_FOLDER}")
 
     # Save with sanitized filename
-    safe_name = "".join(c if c.isalnum() or c in (' ', '_', '-') else '_' for c in board.name)
-    filename = os.path.join(boards_folder, f"{safe_name}.json")
+    safe_name = _safe_name(board.name)
+    filename = os.path.join(_BOARDS_FOLDER, f"{safe_name}.json")
 
     try:
-        with open(filename, "w") as f:
-            json.dump(board.to_dict(), f, indent=2)
+        with open(filename, "wb") as f:
+            f.write(dump_json(board.to_dict()))
+        _load_board_cache()[safe_name] = board
         print(f"Running board '{board.name}' saved successfully.")
         return True
     except Exception as e:
@@ -93,59 +169,28 @@ def save_running_board(board: RunningBoard):
 
 def load_running_board(name: str) -> Optional[RunningBoard]:
     """Load a running board by name"""
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    boards_folder = os.path.join(script_dir, "running_boards")
-
-    if not os.path.exists(boards_folder):
-        return None
+    return _load_board_cache().get(_safe_name(name))
 
-    safe_name = "".join(c if c.isalnum() or c in (' ', '_', '-') else '_' for c in name)
-    filename = os.path.join(boards_folder, f"{safe_name}.json")
 
-    try:
-        with open(filename, "r") as f:
-            data = json.load(f)
-        return RunningBoard.from_dict(data)
-    except FileNotFoundError:
-        return None
-    except Exception as e:
-        print(f"Error loading running board: {e}")
-        return None
+def list_running_board_objects() -> List[RunningBoard]:
+    """All running boards, sorted by name"""
+    return sorted(_load_board_cache().values(), key=lambda board: board.name)
 
 
 def list_running_boards() -> List[str]:
     """List all available running boards"""
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    boards_folder = os.path.join(script_dir, "running_boards")
-
-    if not os.path.exists(boards_folder):
-        return []
-
-    boards = []
-    for filename in os.listdir(boards_folder):
-        if filename.endswith(".json"):
-            try:
-                filepath = os.path.join(boards_folder, filename)
-                with open(filepath, "r") as f:
-                    data = json.load(f)
-                boards.append(data["name"])
-            except:
-                pass
-
-    return sorted(boards)
+    return [board.name for board in list_running_board_objects()]
 
 
 def delete_running_board(name: str) -> bool:
     """Delete a running board file"""
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    boards_folder = os.path.join(script_dir, "running_boards")
-
-    safe_name = "".join(c if c.isalnum() or c in (' ', '_', '-') else '_' for c in name)
-    filename = os.path.join(boards_folder, f"{safe_name}.json")
+    safe_name = _safe_name(name)
+    filename = os.path.join(_BOARDS_FOLDER, f"{safe_name}.json")
 
     try:
         if os.path.exists(filename):
             os.remove(filename)
+            _load_board_cache().pop(safe_name, None)
             print(f"Running board '{name}' deleted.")
             return True
         else:
@@ -195,7 +240,7 @@ def create_running_board_interactive(state):
             continue
 
         # Validate route exists
-        route = next((r for r in state.routes if r.name == route_name), None)
+        route = state.get_route(route_name)
         if not route:
             print(f"  Warning: Route '{route_name}' not found in your routes.")
             confirm = input("  Add anyway? (y/n): ").strip().lower()
@@ -209,18 +254,19 @@ def create_running_board_interactive(state):
 
         while True:
             time_str = input("  Time (HH:MM): ").strip()
-            try:
-                # Validate time format
-                hours, minutes = map(int, time_str.split(':'))
-                if not (0 <= hours <= 23 and 0 <= minutes <= 59):
-                    print("  Invalid time. Hours must be 0-23, minutes 0-59.")
-                    continue
-                time_str = f"{hours:02d}:{minutes:02d}"
-                break
-            except ValueError:
+            # Validate time format
+            match = _TIME_RE.fullmatch(time_str)
+            if not match:
                 print("  Invalid time format. Use HH:MM (e.g., 09:38)")
+                continue
+            hours, minutes = int(match.group(1)), int(match.group(2))
+            if not (0 <= hours <= 23 and 0 <= minutes <= 59):
+                print("  Invalid time. Hours must be 0-23, minutes 0-59.")
+                continue
+            time_str = f"{hours:02d}:{minutes:02d}"
+            break
 
-        trips.append(Trip(route_name, destination, time_str))
+        trips.append(Trip(sys.intern(route_name), sys.intern(destination), sys.intern(time_str)))
         print(f"  ✓ Added: {route_name} to {destination} at {time_str}\n")
 
     if len(trips) == 0:
@@ -248,24 +294,21 @@ def create_running_board_interactive(state):
 
 def view_running_boards(state):
     """View all running boards and manage assignments"""
-    boards_list = list_running_boards()
+    boards = list_running_board_objects()
 
-    if not boards_list:
+    if not boards:
         print("\nNo running boards created yet.")
         return
 
     print("\n--- Running Boards ---")
-    for i, board_name in enumerate(boards_list, 1):
-        board = load_running_board(board_name)
-        if board:
-            bus_info = "Not assigned"
-            if board.assigned_bus_id:
-                bus = next((b for b in state.fleet if b.bus_id == board.assigned_bus_id), None)
-                if bus:
-                    fn = bus.fleet_number if bus.fleet_number else "N/A"
-                    bus_info = f"Bus {bus.bus_id} ({bus.model}, Fleet No: {fn})"
-
-            print(f"[{i}] {board.name} - {len(board.trips)} trips - {bus_info}")
+    for i, board in enumerate(boards, 1):
+        bus_info = "Not assigned"
+        if board.assigned_bus_id is not None:
+            bus = state.get_bus(board.assigned_bus_id)
+            if bus:
+                bus_info = f"Bus {bus.bus_id} ({bus.model}, Fleet No: {bus.display_fleet_no})"
+
+        print(f"[{i}] {board.name} - {len(board.trips)} trips - {bus_info}")
 
     print("\nOptions: [V] View Details, [A] Assign Bus, [D] Delete Board, [Q] Return")
     choice = input("> ").strip().lower()
@@ -306,11 +349,10 @@ def view_running_board_details(state):
     print(f"\n--- Running Board: {board.name} ---")
     print(f"Total trips: {len(board.trips)}")
 
-    if board.assigned_bus_id:
-        bus = next((b for b in state.fleet if b.bus_id == board.assigned_bus_id), None)
+    if board.assigned_bus_id is not None:
+        bus = state.get_bus(board.assigned_bus_id)
         if bus:
-            fn = bus.fleet_number if bus.fleet_number else "N/A"
-            print(f"Assigned to: Bus {bus.bus_id} ({bus.model}, Fleet No: {fn})")
+            print(f"Assigned to: Bus {bus.bus_id} ({bus.model}, Fleet No: {bus.display_fleet_no})")
         else:
             print(f"Assigned to: Bus ID {board.assigned_bus_id} (not found)")
     else:
@@ -318,7 +360,7 @@ def view_running_board_details(state):
 
     print("\nTrips:")
     for i, trip in enumerate(board.trips, 1):
-        route = next((r for r in state.routes if r.name == trip.route_name), None)
+        route = state.get_route(trip.route_name)
         route_status = "✓" if route else "✗ (route not found)"
         print(f"  {i}. {trip.departure_time} - {trip.route_name} to {trip.destination} {route_status}")
 
@@ -345,40 +387,47 @@ def assign_bus_to_running_board(state):
         print(f"Running board '{board_name}' not found.")
         return
 
-    print("\nAvailable buses:")
+    # Group the other boards by the bus they're assigned to, in one pass
+    other_boards_by_bus = {}
+    for other in list_running_board_objects():
+        if other.assigned_bus_id is not None and other.name != board.name:
+            other_boards_by_bus.setdefault(other.assigned_bus_id, []).append(other.name)
+
+    lines = ["\nAvailable buses:"]
     for bus in state.fleet:
-        fn = bus.fleet_number if bus.fleet_number else "N/A"
         # Check if bus is assigned to another running board
-        other_boards = []
-        for other_name in list_running_boards():
-            other = load_running_board(other_name)
-            if other and other.assigned_bus_id == bus.bus_id and other.name != board.name:
-                other_boards.append(other.name)
-
+        other_boards = other_boards_by_bus.get(bus.bus_id)
         assignment = f" (Assigned to: {', '.join(other_boards)})" if other_boards else ""
-        print(f"[{bus.bus_id}] {bus.model} (Fleet No: {fn}){assignment}")
+        lines.append(f"[{bus.bus_id}] {bus.model} (Fleet No: {bus.display_fleet_no}){assignment}")
+    print("\n".join(lines))
 
-    try:
-        bus_id = int(input("\nSelect bus ID (or 0 to unassign): "))
-    except ValueError:
+    bus_id = parse_int(input("\nSelect bus ID (or 0 to unassign): "))
+    if bus_id is None:
         print("Invalid input.")
         return
 
+    # board is the cached copy, so put the old assignment back if the save
+    # fails rather than leave the session disagreeing with the file
+    old_bus_id = board.assigned_bus_id
+
     if bus_id == 0:
         board.assigned_bus_id = None
-        save_running_board(board)
+        if not save_running_board(board):
+            board.assigned_bus_id = old_bus_id
+            return
         print(f"Bus unassigned from running board '{board.name}'.")
         return
 
-    bus = next((b for b in state.fleet if b.bus_id == bus_id), None)
+    bus = state.get_bus(bus_id)
     if not bus:
         print("Bus not found.")
         return
 
     board.assigned_bus_id = bus_id
-    save_running_board(board)
-    fn = bus.fleet_number if bus.fleet_number else "N/A"
-    print(f"Assigned {bus.model} (Fleet No: {fn}) to running board '{board.name}'.")
+    if not save_running_board(board):
+        board.assigned_bus_id = old_bus_id
+        return
+    print(f"Assigned {bus.model} (Fleet No: {bus.display_fleet_no}) to running board '{board.name}'.")
 
 
 def delete_running_board_interactive(state):
@@ -392,7 +441,7 @@ def delete_running_board_interactive(state):
         print(f"Running board '{board_name}' not found.")
         return
 
-    if board.assigned_bus_id:
+    if board.assigned_bus_id is not None:
         print(f"Warning: This running board is assigned to Bus ID {board.assigned_bus_id}.")
 
     confirm = input(f"Are you sure you want to delete '{board_name}'? (y/n): ").strip().lower()
@@ -0,0 +1,51 @@
+import sys
+import json
+from typing import Optional
+
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# orjson is optional (much faster save/load when installed). It is imported on
+# first use rather than at startup; False means it hasn't been looked for yet.
+orjson = False
+
+
+def load_orjson():
+    """Import orjson the first time it's needed; None if it isn't installed"""
+    global orjson
+    if orjson is False:
+        try:
+            import orjson as module
+        except ImportError:
+            module = None
+        orjson = module
+    return orjson
+
+
+def dump_json(data) -> bytes:
+    """Serialise data to indented UTF-8 JSON, using orjson if available.
+
+    Our dataclasses can be passed directly: orjson serialises them natively
+    (skipping the _-prefixed cache fields, so the output matches to_dict()),
+    and the json fallback calls to_dict() on them.
+    """
+    fast_json = load_orjson()
+    if fast_json is not None:
+        return fast_json.dumps(data, option=fast_json.OPT_INDENT_2)
+    return json.dumps(data, indent=2, default=lambda obj: obj.to_dict()).encode("utf-8")
+
+
+def parse_json(raw: bytes):
+    """Parse JSON bytes, using orjson if available"""
+    fast_json = load_orjson()
+    if fast_json is not None:
+        return fast_json.loads(raw)
+    return json.loads(raw)
+
+
+def parse_int(text: str) -> Optional[int]:
+    """Whole number typed by the player, or None if it isn't one"""
+    # Checked up front rather than letting int() raise on bad input
+    text = text.strip()
+    digits = text[1:] if text[:1] in ("-", "+") else text
+    return int(text) if digits.isdecimal() else None